@@ -17,8 +17,12 @@ VECTORSTORE_PATH = "faiss_index_gemma_local"
 EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2" 
 OLLAMA_MODEL_NAME = "mistral:7b-instruct-v0.2-q4_K_M"
 INDEX_BATCH_SIZE = 500 
+CHUNK_SIZE = 800
+CHUNK_OVERLAP = 100
+RETRIEVER_K = 3
 
-def load_or_create_vectorstore(data_path, vectorstore_path, embedding_model, batch_size):
+def load_or_create_vectorstore(data_path, vectorstore_path, embedding_model, batch_size,
+                               chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP):
     """Loads an existing FAISS index or creates a new one from the text file using batch processing."""
     if os.path.exists(vectorstore_path):
         print(f"Loading existing vector index from '{vectorstore_path}'...")
@@ -44,7 +48,7 @@ def load_or_create_vectorstore(data_path, vectorstore_path, embedding_model, bat
             return None
 
         # Chunk-Grösse & Overlap
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=800, chunk_overlap=100)
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
         docs = text_splitter.split_documents(documents)
         total_docs = len(docs)
         print(f"{total_docs} text chunks created.")
@@ -88,20 +92,25 @@ def load_or_create_vectorstore(data_path, vectorstore_path, embedding_model, bat
         traceback.print_exc()
         return None
 
-def create_rag_chain(vectorstore, ollama_model_name):
-    """Initializes Ollama and creates the RetrievalQA Chain."""
-    print(f"Initializing Ollama with model: {ollama_model_name}...")
-    print("Make sure the Ollama service is running!")
-    try:
-        llm = Ollama(model=ollama_model_name)
-        print(f"Ollama LLM '{ollama_model_name}' initialized successfully.")
-    except Exception as e:
-        print(f"\nERROR: Could not initialize Ollama LLM '{ollama_model_name}'.")
-        print("Possible reasons:")
-        print("- Is the Ollama service running? (Start it or use 'ollama serve')")
-        print(f"- Is the model '{ollama_model_name}' downloaded correctly? ('ollama list')")
-        print(f"Error message: {e}")
-        return None
+def create_retriever(vectorstore, k=RETRIEVER_K):
+    """Creates the retriever used by the RAG chain (also used by evaluate.py)."""
+    return vectorstore.as_retriever(search_kwargs={"k": k})
+
+def create_rag_chain(vectorstore, ollama_model_name, llm=None, k=RETRIEVER_K):
+    """Initializes Ollama (unless an LLM is passed in) and creates the RetrievalQA Chain."""
+    if llm is None:
+        print(f"Initializing Ollama with model: {ollama_model_name}...")
+        print("Make sure the Ollama service is running!")
+        try:
+            llm = Ollama(model=ollama_model_name)
+            print(f"Ollama LLM '{ollama_model_name}' initialized successfully.")
+        except Exception as e:
+            print(f"\nERROR: Could not initialize Ollama LLM '{ollama_model_name}'.")
+            print("Possible reasons:")
+            print("- Is the Ollama service running? (Start it or use 'ollama serve')")
+            print(f"- Is the model '{ollama_model_name}' downloaded correctly? ('ollama list')")
+            print(f"Error message: {e}")
+            return None
 
     print("Creating the Prompt Template...")
     prompt_template = """<|start_of_turn|>user
@@ -122,7 +131,7 @@ Answer in English:"""
 
     print("Creating the Retriever...")
     # K-Wert
-    retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
+    retriever = create_retriever(vectorstore, k)
 
     print("Creating the RetrievalQA Chain...")
     qa_chain = RetrievalQA.from_chain_type(
@@ -0,0 +1,89 @@
+import json
+import math
+
+INDEX_TYPES = {"flat", "hnsw"}
+
+
+def normalize(text):
+    """Lowercases the text and collapses whitespace, so passages match across chunk boundaries and line breaks."""
+    return " ".join(text.lower().split())
+
+
+def load_questions(path):
+    """Loads the golden question set (list of {question, expected_passages, answer_keywords})."""
+    with open(path, encoding="utf-8") as f:
+        questions = json.load(f)
+    if not isinstance(questions, list):
+        raise ValueError(f"'{path}' must contain a JSON list of questions.")
+    if not questions:
+        raise ValueError(f"'{path}' contains no evaluation questions.")
+    for i, item in enumerate(questions):
+        if not item.get("question") or not item.get("expected_passages"):
+            raise ValueError(f"Entry {i} in '{path}' needs 'question' and 'expected_passages'.")
+    return questions
+
+
+def config_name(config):
+    """Builds a readable name from the settings of a config that has none."""
+    model_slug = config["embedding_model"].split("/")[-1]
+    return (f"{model_slug}-c{config['chunk_size']}-o{config['chunk_overlap']}"
+            f"-k{config['k']}-{config['index_type']}")
+
+
+def merge_configs(raw_configs, defaults):
+    """Fills missing keys of user-supplied configs with `defaults` and validates them."""
+    if not isinstance(raw_configs, list):
+        raise ValueError("The config file must contain a JSON list of configurations.")
+    configs = []
+    for i, raw in enumerate(raw_configs):
+        if not isinstance(raw, dict):
+            raise ValueError(f"Config {i} must be a JSON object, got {type(raw).__name__}.")
+        config = {**defaults, **raw}
+        config["name"] = raw.get("name") or config_name(config)
+        k = config["k"]
+        if isinstance(k, bool) or not isinstance(k, int) or k < 1:
+            raise ValueError(f"Config {i} ('{config['name']}') has invalid k {k!r}, expected a positive integer.")
+        if config["index_type"] not in INDEX_TYPES:
+            raise ValueError(f"Config {i} ('{config['name']}') has unknown index_type '{config['index_type']}', "
+                             f"expected one of {sorted(INDEX_TYPES)}.")
+        if any(c["name"] == config["name"] for c in configs):
+            raise ValueError(f"Config {i} has duplicate name '{config['name']}'.")
+        configs.append(config)
+    return configs
+
+
+def find_unmatched_passages(questions, chunk_texts):
+    """Returns (question, passage) pairs whose passage occurs in no chunk of the corpus."""
+    chunks = [normalize(text) for text in chunk_texts]
+    unmatched = []
+    for item in questions:
+        for passage in item["expected_passages"]:
+            normalized = normalize(passage)
+            if not any(normalized in chunk for chunk in chunks):
+                unmatched.append((item["question"], passage))
+    return unmatched
+
+
+def first_relevant_rank(docs, expected_passages):
+    """Returns the 1-based rank of the first retrieved chunk containing an expected passage, or None."""
+    passages = [normalize(p) for p in expected_passages]
+    for rank, doc in enumerate(docs, start=1):
+        content = normalize(doc.page_content)
+        if any(p in content for p in passages):
+            return rank
+    return None
+
+
+def answer_score(answer, keywords):
+    """Fraction of expected answer keywords that appear in the generated answer."""
+    if not keywords:
+        return None
+    answer = normalize(answer)
+    return sum(normalize(kw) in answer for kw in keywords) / len(keywords)
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
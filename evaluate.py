@@ -0,0 +1,258 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.language_models.llms import LLM
+
+from chatbot import (
+    load_or_create_vectorstore,
+    create_retriever,
+    create_rag_chain,
+    DATA_PATH,
+    VECTORSTORE_PATH,
+    EMBEDDING_MODEL_NAME,
+    OLLAMA_MODEL_NAME,
+    INDEX_BATCH_SIZE,
+    CHUNK_SIZE,
+    CHUNK_OVERLAP,
+    RETRIEVER_K
+)
+from eval_metrics import (
+    load_questions,
+    merge_configs,
+    find_unmatched_passages,
+    first_relevant_rank,
+    answer_score,
+    percentile
+)
+
+QUESTIONS_PATH = "eval_questions.json"
+
+# Standardwerte = Einstellungen des Chatbots; fehlende Schlüssel in --configs werden damit ergänzt
+CONFIG_DEFAULTS = {"embedding_model": EMBEDDING_MODEL_NAME, "chunk_size": CHUNK_SIZE,
+                   "chunk_overlap": CHUNK_OVERLAP, "k": RETRIEVER_K, "index_type": "flat"}
+
+# Index-Konfigurationen, die nebeneinander verglichen werden
+# (index_type: "flat" = exakte Suche wie im Chatbot, "hnsw" = approximative Suche)
+EVAL_CONFIGS = [
+    {**CONFIG_DEFAULTS, "name": "baseline"},
+    {**CONFIG_DEFAULTS, "name": "baseline-k5", "k": 5},
+    {**CONFIG_DEFAULTS, "name": "hnsw", "index_type": "hnsw"},
+]
+
+HNSW_NEIGHBORS = 32
+DEFAULT_REPEAT = 5
+
+
+class StubLLM(LLM):
+    """Local stand-in for Ollama: answers with the retrieved context, so the chain runs without a model.
+
+    Only a plumbing smoke test - its answers just restate the retrieved chunks, so they are not scored.
+    """
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub"
+
+    def _call(self, prompt, stop=None, run_manager=None, **kwargs):
+        context = prompt.split("Context:", 1)[-1].split("Question:", 1)[0]
+        return context.strip()
+
+
+def vectorstore_path_for(config):
+    """Returns the on-disk index path for a config; the chatbot's own settings reuse the chatbot's index."""
+    if (config["embedding_model"], config["chunk_size"], config["chunk_overlap"]) == \
+            (EMBEDDING_MODEL_NAME, CHUNK_SIZE, CHUNK_OVERLAP):
+        return VECTORSTORE_PATH
+    model_slug = config["embedding_model"].replace("/", "_")
+    return f"{VECTORSTORE_PATH}_eval_{model_slug}_{config['chunk_size']}_{config['chunk_overlap']}"
+
+
+def to_hnsw(vectorstore):
+    """Copies the vectors of a flat FAISS store into an HNSW index sharing the same docstore."""
+    import faiss
+
+    flat_index = vectorstore.index
+    hnsw_index = faiss.IndexHNSWFlat(flat_index.d, HNSW_NEIGHBORS)
+    hnsw_index.add(flat_index.reconstruct_n(0, flat_index.ntotal))
+    return FAISS(
+        embedding_function=vectorstore.embedding_function,
+        index=hnsw_index,
+        docstore=vectorstore.docstore,
+        index_to_docstore_id=vectorstore.index_to_docstore_id,
+    )
+
+
+def corpus_chunks(vectorstore):
+    """Returns the text of every chunk stored in the FAISS docstore."""
+    return [vectorstore.docstore.search(doc_id).page_content
+            for doc_id in vectorstore.index_to_docstore_id.values()]
+
+
+def time_query(vectorstore, question, k, repeat):
+    """Times query embedding and FAISS search separately, `repeat` times each, and returns both sample lists in ms."""
+    embed_ms, search_ms = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        vector = vectorstore.embedding_function.embed_query(question)
+        embed_ms.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        vectorstore.similarity_search_by_vector(vector, k=k)
+        search_ms.append((time.perf_counter() - start) * 1000)
+    return embed_ms, search_ms
+
+
+def evaluate_config(vectorstore, config, questions, llm=None, score_answers=True, repeat=DEFAULT_REPEAT):
+    """Runs all questions through the retriever of one config and returns the aggregated metrics."""
+    retriever = create_retriever(vectorstore, config["k"])
+    # Warm-up, damit das Laden des Embedding-Modells nicht in die Latenz einfliesst
+    retriever.invoke(questions[0]["question"])
+
+    embed_ms, search_ms, reciprocal_ranks, hits, answer_scores, queries = [], [], [], 0, [], []
+    for item in questions:
+        docs = retriever.invoke(item["question"])
+        query_embed_ms, query_search_ms = time_query(vectorstore, item["question"], config["k"], repeat)
+        embed_ms.extend(query_embed_ms)
+        search_ms.extend(query_search_ms)
+
+        rank = first_relevant_rank(docs, item["expected_passages"])
+        queries.append({
+            "question": item["question"],
+            "rank": rank,
+            "embed_median_ms": statistics.median(query_embed_ms),
+            "search_median_ms": statistics.median(query_search_ms),
+        })
+        if rank is not None:
+            hits += 1
+            reciprocal_ranks.append(1 / rank)
+        else:
+            reciprocal_ranks.append(0.0)
+
+    if llm is not None:
+        rag_chain = create_rag_chain(vectorstore, OLLAMA_MODEL_NAME, llm=llm, k=config["k"])
+        for item in questions:
+            try:
+                result = rag_chain.invoke({"query": item["question"]})
+            except Exception as e:
+                print(f"ERROR answering '{item['question']}': {e}")
+                continue
+            if not score_answers:
+                continue
+            score = answer_score(result["result"], item.get("answer_keywords", []))
+            if score is not None:
+                answer_scores.append(score)
+
+    return {
+        "name": config["name"],
+        "k": config["k"],
+        "recall": hits / len(questions),
+        "mrr": statistics.mean(reciprocal_ranks),
+        "embed_mean_ms": statistics.mean(embed_ms),
+        "search_mean_ms": statistics.mean(search_ms),
+        "search_p50_ms": percentile(search_ms, 50),
+        "search_p95_ms": percentile(search_ms, 95),
+        "answer_score": statistics.mean(answer_scores) if answer_scores else None,
+        "queries": queries,
+    }
+
+
+def print_report(results):
+    """Prints one row per config, fastest search first among those with equal recall."""
+    width = max(20, *(len(r["name"]) for r in results))
+    header = (f"{'Config':<{width}} {'k':>3} {'Recall@k':>9} {'MRR':>6} {'Embed ms':>9} "
+              f"{'Search ms':>10} {'p50 ms':>8} {'p95 ms':>8} {'Answer':>7}")
+    print("\n--- Retrieval Evaluation ---")
+    print(header)
+    print("-" * len(header))
+    for r in sorted(results, key=lambda r: (-r["recall"], r["search_p50_ms"])):
+        answer = f"{r['answer_score']:.2f}" if r["answer_score"] is not None else "-"
+        print(f"{r['name']:<{width}} {r['k']:>3} {r['recall']:>9.2f} {r['mrr']:>6.2f} {r['embed_mean_ms']:>9.2f} "
+              f"{r['search_mean_ms']:>10.3f} {r['search_p50_ms']:>8.3f} {r['search_p95_ms']:>8.3f} {answer:>7}")
+    print("-" * len(header))
+
+    for r in results:
+        misses = [q for q in r["queries"] if q["rank"] is None]
+        if misses:
+            print(f"\nMissed by '{r['name']}' (no expected passage in the top {r['k']}):")
+            for q in misses:
+                print(f"- {q['question']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline retrieval-quality and latency evaluation for the RAG chatbot.")
+    parser.add_argument("--questions", default=QUESTIONS_PATH, help="Path to the golden question set (JSON).")
+    parser.add_argument("--configs", help="Optional JSON file with a list of index configurations to compare.")
+    parser.add_argument("--answers", choices=["none", "stub", "ollama"], default="none",
+                        help="Also run the RAG chain: 'ollama' scores the real model's answers, "
+                             "'stub' is only a plumbing smoke test and leaves the Answer column empty.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                        help="How often each query is embedded and searched for the latency measurement.")
+    parser.add_argument("--output", help="Optional path to write the results as JSON.")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1.")
+
+    questions = load_questions(args.questions)
+    print(f"{len(questions)} evaluation question(s) loaded from '{args.questions}'.")
+
+    configs = EVAL_CONFIGS
+    if args.configs:
+        with open(args.configs, encoding="utf-8") as f:
+            configs = merge_configs(json.load(f), CONFIG_DEFAULTS)
+
+    llm = None
+    if args.answers == "stub":
+        llm = StubLLM()
+    elif args.answers == "ollama":
+        from langchain_community.llms import Ollama
+        llm = Ollama(model=OLLAMA_MODEL_NAME)
+
+    # Indizes werden pro (Modell, Chunking) nur einmal geladen bzw. erstellt und geprüft
+    vectorstores = {}
+    results = []
+    for config in configs:
+        print(f"\nEvaluating config '{config['name']}'...")
+        path = vectorstore_path_for(config)
+        if path not in vectorstores:
+            vectorstores[path] = load_or_create_vectorstore(
+                DATA_PATH, path, config["embedding_model"], INDEX_BATCH_SIZE,
+                chunk_size=config["chunk_size"], chunk_overlap=config["chunk_overlap"]
+            )
+            if vectorstores[path] is not None:
+                # Passagen, die in keinem Chunk vorkommen, würden den Recall jeder Konfiguration stillschweigend senken
+                unmatched = find_unmatched_passages(questions, corpus_chunks(vectorstores[path]))
+                if unmatched:
+                    print(f"ERROR: {len(unmatched)} expected passage(s) occur in no chunk of '{path}':")
+                    for question, passage in unmatched:
+                        print(f"- '{passage}' (question: {question})")
+                    print(f"Fix the passages in '{args.questions}' so they are copied verbatim from '{DATA_PATH}'.")
+                    return 1
+        vectorstore = vectorstores[path]
+        if vectorstore is None:
+            print(f"ERROR: Skipping config '{config['name']}' (Vector Store creation/loading failed).")
+            continue
+        if config["index_type"] == "hnsw":
+            vectorstore = to_hnsw(vectorstore)
+
+        results.append(evaluate_config(vectorstore, config, questions, llm,
+                                       score_answers=args.answers == "ollama", repeat=args.repeat))
+
+    if not results:
+        print("No configuration could be evaluated.")
+        return 1
+
+    print_report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to '{args.output}'.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import eval_metrics
+
+DEFAULTS = {"embedding_model": "all-MiniLM-L6-v2", "chunk_size": 800, "chunk_overlap": 100,
+            "k": 3, "index_type": "flat"}
+
+
+def make_docs(*contents):
+    return [SimpleNamespace(page_content=c) for c in contents]
+
+
+def test_percentile_nearest_rank():
+    assert eval_metrics.percentile([1, 2, 3, 4, 5], 50) == 3
+    assert eval_metrics.percentile([1, 2, 3, 4], 50) == 2
+    assert eval_metrics.percentile([5, 1, 4, 2, 3, 7, 6], 50) == 4
+    assert eval_metrics.percentile(list(range(1, 21)), 95) == 19
+    assert eval_metrics.percentile([1, 2, 3], 100) == 3
+    assert eval_metrics.percentile([1, 2, 3], 0) == 1
+    assert eval_metrics.percentile([42], 95) == 42
+
+
+def test_first_relevant_rank_matches_normalized_passage():
+    docs = make_docs(
+        "Arjuna looked at the two armies.",
+        "Then Krishna drove Arjuna's\nchariot   between the TWO armies.",
+        "Krishna drove Arjuna's chariot between the two armies again.",
+    )
+    assert eval_metrics.first_relevant_rank(docs, ["Krishna drove Arjuna's chariot between the two armies"]) == 2
+
+
+def test_first_relevant_rank_returns_none_without_match():
+    docs = make_docs("Bhishma lay on a bed of arrows.", "Drona fell in battle.")
+    assert eval_metrics.first_relevant_rank(docs, ["Karna was the son of Kunti and Surya"]) is None
+    assert eval_metrics.first_relevant_rank([], ["anything"]) is None
+
+
+def test_answer_score():
+    assert eval_metrics.answer_score("It was KRISHNA, the charioteer.", ["Krishna"]) == 1.0
+    assert eval_metrics.answer_score("Krishna and Arjuna", ["Krishna", "Sanjaya"]) == 0.5
+    assert eval_metrics.answer_score("No idea.", ["Krishna"]) == 0.0
+    assert eval_metrics.answer_score("Krishna", []) is None
+
+
+def test_find_unmatched_passages_reports_only_missing_passages():
+    chunks = ["Bhishma lay on a bed\nof arrows for many days.", "Drona fell in battle."]
+    questions = [
+        {"question": "Where did Bhishma lie?", "expected_passages": ["bhishma lay on a bed of arrows"]},
+        {"question": "Who fell?", "expected_passages": ["Drona fell in battle", "Drona fel in battle"]},
+        {"question": "Who was Karna?", "expected_passages": ["Karna was the son of Kunti"]},
+    ]
+    assert eval_metrics.find_unmatched_passages(questions, chunks) == [
+        ("Who fell?", "Drona fel in battle"),
+        ("Who was Karna?", "Karna was the son of Kunti"),
+    ]
+
+
+def test_find_unmatched_passages_empty_when_all_match():
+    questions = [{"question": "Who fell?", "expected_passages": ["drona fell"]}]
+    assert eval_metrics.find_unmatched_passages(questions, ["Drona fell in battle."]) == []
+
+
+def test_merge_configs_fills_defaults():
+    configs = eval_metrics.merge_configs([{"name": "k10", "k": 10}, {"name": "small-chunks", "chunk_size": 400}],
+                                         DEFAULTS)
+    assert configs[0]["k"] == 10
+    assert configs[0]["chunk_size"] == 800
+    assert configs[0]["index_type"] == "flat"
+    assert configs[1]["k"] == 3
+    assert configs[1]["chunk_size"] == 400
+    assert configs[1]["embedding_model"] == "all-MiniLM-L6-v2"
+
+
+def test_merge_configs_generates_distinct_names():
+    configs = eval_metrics.merge_configs([{"k": 5}, {"index_type": "hnsw"},
+                                          {"embedding_model": "sentence-transformers/all-mpnet-base-v2"}], DEFAULTS)
+    assert [c["name"] for c in configs] == [
+        "all-MiniLM-L6-v2-c800-o100-k5-flat",
+        "all-MiniLM-L6-v2-c800-o100-k3-hnsw",
+        "all-mpnet-base-v2-c800-o100-k3-flat",
+    ]
+
+
+def test_merge_configs_rejects_duplicate_names():
+    with pytest.raises(ValueError, match="duplicate name"):
+        eval_metrics.merge_configs([{"k": 5}, {"k": 5}], DEFAULTS)
+
+
+@pytest.mark.parametrize("index_type", ["HNSW", "ivf", ""])
+def test_merge_configs_rejects_unknown_index_type(index_type):
+    with pytest.raises(ValueError, match="index_type"):
+        eval_metrics.merge_configs([{"name": "typo", "index_type": index_type}], DEFAULTS)
+
+
+@pytest.mark.parametrize("k", [0, -1, "3", 2.5, True, None])
+def test_merge_configs_rejects_invalid_k(k):
+    with pytest.raises(ValueError, match="invalid k"):
+        eval_metrics.merge_configs([{"name": "bad-k", "k": k}], DEFAULTS)
+
+
+@pytest.mark.parametrize("raw", [{"name": "not-a-list"}, "baseline", None])
+def test_merge_configs_rejects_non_list(raw):
+    with pytest.raises(ValueError, match="JSON list"):
+        eval_metrics.merge_configs(raw, DEFAULTS)
+
+
+def test_merge_configs_rejects_non_object_entry():
+    with pytest.raises(ValueError, match="JSON object"):
+        eval_metrics.merge_configs([5], DEFAULTS)
+
+
+def test_load_questions_rejects_empty_list(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text("[]", encoding="utf-8")
+    with pytest.raises(ValueError, match="no evaluation questions"):
+        eval_metrics.load_questions(path)
+
+
+def test_load_questions_rejects_non_list(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps({"question": "Who?"}), encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON list"):
+        eval_metrics.load_questions(path)
+
+
+def test_load_questions_requires_expected_passages(tmp_path):
+    path = tmp_path / "questions.json"
+    path.write_text(json.dumps([{"question": "Who?", "expected_passages": []}]), encoding="utf-8")
+    with pytest.raises(ValueError, match="expected_passages"):
+        eval_metrics.load_questions(path)
+
+
+def test_golden_question_set_passages_are_not_bare_names():
+    questions = eval_metrics.load_questions(Path(__file__).resolve().parent.parent / "eval_questions.json")
+    for item in questions:
+        for passage in item["expected_passages"]:
+            # Einzelne Namen kommen in fast jedem Chunk vor und messen keinen Recall
+            assert len(passage.split()) >= 3, passage
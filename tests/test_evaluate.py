@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("langchain_community")
+pytest.importorskip("langchain_core")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import evaluate
+from chatbot import VECTORSTORE_PATH, EMBEDDING_MODEL_NAME, CHUNK_SIZE, CHUNK_OVERLAP
+
+
+def test_vectorstore_path_for_reuses_chatbot_index():
+    config = {"embedding_model": EMBEDDING_MODEL_NAME, "chunk_size": CHUNK_SIZE, "chunk_overlap": CHUNK_OVERLAP}
+    assert evaluate.vectorstore_path_for(config) == VECTORSTORE_PATH
+
+
+def test_vectorstore_path_for_separates_other_settings():
+    config = {"embedding_model": "sentence-transformers/all-mpnet-base-v2", "chunk_size": 500, "chunk_overlap": 50}
+    path = evaluate.vectorstore_path_for(config)
+    assert path == f"{VECTORSTORE_PATH}_eval_sentence-transformers_all-mpnet-base-v2_500_50"
+    assert path != evaluate.vectorstore_path_for({**config, "chunk_overlap": 100})
+
+
+def test_corpus_chunks_reads_every_docstore_entry():
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_core.documents import Document
+
+    docstore = InMemoryDocstore({"a": Document(page_content="Drona fell in battle."),
+                                 "b": Document(page_content="Bhishma lay on a bed of arrows.")})
+    vectorstore = SimpleNamespace(docstore=docstore, index_to_docstore_id={0: "a", 1: "b"})
+    assert evaluate.corpus_chunks(vectorstore) == ["Drona fell in battle.", "Bhishma lay on a bed of arrows."]